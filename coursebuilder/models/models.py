@@ -1210,6 +1210,11 @@ class BaseJsonDao(object):
         # Keeping case-sensitivity in kind() because Foo(object) != foo(object).
         return '(entity-get-all:%s)' % cls.ENTITY.kind()
 
+    @classmethod
+    def _invalidate_get_all_cache(cls):
+        """Evicts cached get_all() results after entities have changed."""
+        MemcacheManager.delete(cls._memcache_all_key())
+
     @classmethod
     def get_all_mapped(cls):
         # try to get from memcache
@@ -1378,7 +1383,7 @@ class BaseJsonDao(object):
         entity = cls._create_if_necessary(dto)
         cls.before_put(dto, entity)
         entity.put()
-        MemcacheManager.delete(cls._memcache_all_key())
+        cls._invalidate_get_all_cache()
         id_or_name = entity.key().id_or_name()
         MemcacheManager.set(cls._memcache_key(id_or_name), entity)
         cls._maybe_apply_post_save_hooks([(id_or_name, dto)])
@@ -1394,11 +1399,12 @@ class BaseJsonDao(object):
             cls.before_put(dto, entity)
 
         keys = db.put(entities)
-        MemcacheManager.delete(cls._memcache_all_key())
-        for key, entity in zip(keys, entities):
-            MemcacheManager.set(cls._memcache_key(key.id_or_name()), entity)
-
+        cls._invalidate_get_all_cache()
         id_or_name_list = [key.id_or_name() for key in keys]
+        MemcacheManager.set_multi({
+            cls._memcache_key(id_or_name): entity
+            for id_or_name, entity in zip(id_or_name_list, entities)})
+
         cls._maybe_apply_post_save_hooks(zip(id_or_name_list, dtos))
         return id_or_name_list
 
@@ -1406,7 +1412,7 @@ class BaseJsonDao(object):
     def delete(cls, dto):
         entity = cls._load_entity(dto.id)
         entity.delete()
-        MemcacheManager.delete(cls._memcache_all_key())
+        cls._invalidate_get_all_cache()
         MemcacheManager.delete(cls._memcache_key(entity.key().id_or_name()))
 
     @classmethod
@@ -1481,6 +1487,37 @@ class QuestionDAO(LastModfiedJsonDao):
     # Enable other modules to add post-save transformations
     POST_SAVE_HOOKS = []
 
+    @classmethod
+    def _memcache_descriptions_key(cls):
+        """Makes a memcache key for caching question ids by description."""
+        return '(entity-descriptions:%s)' % cls.ENTITY.kind()
+
+    @classmethod
+    def _invalidate_get_all_cache(cls):
+        MemcacheManager.delete_multi(
+            [cls._memcache_all_key(), cls._memcache_descriptions_key()])
+
+    @classmethod
+    def _get_description_to_ids_map(cls):
+        """Returns a dict mapping each question description to question ids."""
+        ids_by_description = MemcacheManager.get(
+            cls._memcache_descriptions_key())
+        if ids_by_description is not None:
+            return ids_by_description
+
+        ids_by_description = {}
+        for question in cls.get_all():
+            ids_by_description.setdefault(
+                question.description, []).append(question.id)
+        MemcacheManager.set(
+            cls._memcache_descriptions_key(), ids_by_description)
+        return ids_by_description
+
+    @classmethod
+    def get_ids_by_description(cls, description):
+        """Returns the ids of all questions having the given description."""
+        return cls._get_description_to_ids_map().get(description, [])
+
     @classmethod
     def used_by(cls, question_id):
         """Returns the question groups using a question.
@@ -1511,7 +1548,7 @@ class QuestionDAO(LastModfiedJsonDao):
 
     @classmethod
     def get_questions_descriptions(cls):
-        return set([q.description for q in cls.get_all()])
+        return frozenset(cls._get_description_to_ids_map())
 
     @classmethod
     def validate_unique_description(cls, description):
@@ -1795,9 +1832,25 @@ class QuestionGroupDAO(LastModfiedJsonDao):
     # Enable other modules to add post-save transformations
     POST_SAVE_HOOKS = []
 
+    @classmethod
+    def _memcache_descriptions_key(cls):
+        """Makes a memcache key for caching question group descriptions."""
+        return '(entity-descriptions:%s)' % cls.ENTITY.kind()
+
+    @classmethod
+    def _invalidate_get_all_cache(cls):
+        MemcacheManager.delete_multi(
+            [cls._memcache_all_key(), cls._memcache_descriptions_key()])
+
     @classmethod
     def get_question_groups_descriptions(cls):
-        return set([g.description for g in cls.get_all()])
+        descriptions = MemcacheManager.get(cls._memcache_descriptions_key())
+        if descriptions is not None:
+            return descriptions
+
+        descriptions = frozenset([g.description for g in cls.get_all()])
+        MemcacheManager.set(cls._memcache_descriptions_key(), descriptions)
+        return descriptions
 
     @classmethod
     def create_question_group(cls, question_group_dict):
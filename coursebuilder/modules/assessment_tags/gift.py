@@ -492,11 +492,18 @@ class GiftParser(object):
             logging.exception('Invalid GIFT syntax: %s', text)
             raise ParseError(e.msg)
 
+    @classmethod
+    def iter_parse_questions(cls, text):
+        """Yields question dicts converted from new-line separated GIFT."""
+        tree = cls.parse(text)
+        adapter = GiftAdapter()
+        for node in tree:
+            yield adapter.convert_to_question(node)
+
     @classmethod
     def parse_questions(cls, text):
         """Parses a list new-line separated GIFT questions to."""
-        tree = cls.parse(text)
-        return [GiftAdapter().convert_to_question(node) for node in tree]
+        return list(cls.iter_parse_questions(text))
 
 
 class GiftAdapter(object):
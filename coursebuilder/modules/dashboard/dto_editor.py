@@ -157,6 +157,15 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
         """Subclass provides default values to initialize editor form."""
         raise NotImplementedError('Subclasses must override this function.')
 
+    @classmethod
+    def get_json_schema_dict(cls):
+        """Get the JSON schema dict used to convert the editor payload.
+
+        Subclasses with a static schema may override this to return a
+        precomputed dict; it is treated as read-only.
+        """
+        return cls.get_schema().get_json_schema_dict()
+
     def put(self):
         """Store a DTO in the datastore in response to a PUT."""
         request = transforms.loads(self.request.get('request'))
@@ -178,7 +187,7 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
         errors = []
         try:
             python_dict = transforms.json_to_dict(
-                json_dict, self.get_schema().get_json_schema_dict())
+                json_dict, self.get_json_schema_dict())
 
             version = python_dict.get('version')
             if version not in self.SCHEMA_VERSIONS:
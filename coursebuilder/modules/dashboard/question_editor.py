@@ -16,7 +16,7 @@
 
 __author__ = 'John Orr (jorr@google.com)'
 
-import copy
+import re
 
 import messages
 
@@ -37,6 +37,55 @@ from modules.dashboard import utils as dashboard_utils
 TAGS_EXCLUDED_FROM_QUESTIONS = set(
     ['question', 'question-group', 'gcb-questionnaire', 'text-file-upload-tag'])
 
+# Question types produced by the GIFT parser; all others are short answer.
+_GIFT_TYPE_MAP = {'multi_choice': QuestionDTO.MULTIPLE_CHOICE}
+
+# Numbers accepted by float() and int(), except for special values such as
+# 'nan' and 'inf'. Matching them up front keeps ValueError off the common path.
+_FLOAT_RE = re.compile(r'^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$')
+_INT_RE = re.compile(r'^\s*[-+]?\d+\s*$')
+
+# Schemas built by the REST handlers below, keyed by handler class and the
+# value of the dynamic tags setting, which is baked into the rich text fields.
+# Each entry is a (schema, json_schema_dict) pair; treat both as read-only.
+_SCHEMA_CACHE = {}
+
+
+def _get_cached_schema(handler_class):
+    """Get the (schema, json_schema_dict) pair for a REST handler class."""
+    can_use_dynamic_tags = tags.CAN_USE_DYNAMIC_TAGS.value
+    cache_key = (handler_class, can_use_dynamic_tags)
+    entry = _SCHEMA_CACHE.get(cache_key)
+    if entry is None:
+        # pylint: disable=protected-access
+        schema = handler_class._build_schema(can_use_dynamic_tags)
+        entry = (schema, schema.get_json_schema_dict())
+        _SCHEMA_CACHE[cache_key] = entry
+    return entry
+
+
+def _rich_text_extras(can_use_dynamic_tags, class_name):
+    """Get extra schema dict values for a rich text field of a question.
+
+    Every field needs a dict of its own, since SchemaField adds its label and
+    other annotations to it.
+    """
+    return {
+        'supportCustomTags': can_use_dynamic_tags,
+        'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
+        'className': class_name}
+
+
+def _to_number(value, number_re, number_type):
+    """Coerce value to number_type; return None if it is not a number."""
+    if isinstance(value, basestring):
+        if not number_re.match(value):
+            return None
+    elif not isinstance(value, (int, long, float)):
+        return None
+    return number_type(value)
+
+
 class QuestionManagerAndEditor(dto_editor.BaseDatastoreAssetEditor):
     """An editor for editing and managing questions."""
 
@@ -100,20 +149,30 @@ class BaseQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
 
         used_by = QuestionDAO.used_by(question.id)
         if used_by:
-            group_names = sorted(['"%s"' % x.description for x in used_by])
+            group_names = ',\n'.join(
+                '"%s"' % description
+                for description in sorted(x.description for x in used_by))
             transforms.send_json_response(
                 self, 403,
                 ('Question in use by question groups:\n%s.\nPlease delete it '
-                 'from those groups and try again.') % ',\n'.join(group_names),
+                 'from those groups and try again.') % group_names,
                 {'key': question.id})
             return False
         else:
             return True
 
+    @classmethod
+    def get_json_schema_dict(cls):
+        """Get the JSON schema dict of the schema returned by get_schema()."""
+        return _get_cached_schema(cls)[1]
+
     def validate_no_description_collision(self, description, key, errors):
-        descriptions = {q.description for q in QuestionDAO.get_all()
-                        if not key or q.id != long(key)}
-        if description in descriptions:
+        excluded_id = long(key) if key else None
+        colliding_ids = [
+            question_id
+            for question_id in QuestionDAO.get_ids_by_description(description)
+            if question_id != excluded_id]
+        if colliding_ids:
             errors.append(
                 'The description must be different from existing questions.')
 
@@ -137,6 +196,10 @@ class McQuestionRESTHandler(BaseQuestionRESTHandler):
     @classmethod
     def get_schema(cls):
         """Get the InputEx schema for the multiple choice question editor."""
+        return _get_cached_schema(cls)[0]
+
+    @classmethod
+    def _build_schema(cls, can_use_dynamic_tags):
         mc_question = schema_fields.FieldRegistry(
             'Multiple Choice Question',
             description='multiple choice question',
@@ -146,10 +209,8 @@ class McQuestionRESTHandler(BaseQuestionRESTHandler):
             'version', '', 'string', optional=True, hidden=True))
         mc_question.add_property(schema_fields.SchemaField(
             'question', 'Question', 'html', optional=True,
-            extra_schema_dict_values={
-                'supportCustomTags': tags.CAN_USE_DYNAMIC_TAGS.value,
-                'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
-                'className': 'mc-question'}))
+            extra_schema_dict_values=_rich_text_extras(
+                can_use_dynamic_tags, 'mc-question')))
         mc_question.add_property(schema_fields.SchemaField(
             'description', 'Description', 'string', optional=True,
             extra_schema_dict_values={'className': 'mc-description'},
@@ -173,16 +234,12 @@ class McQuestionRESTHandler(BaseQuestionRESTHandler):
                 'className': 'mc-choice-score', 'value': '0'}))
         choice_type.add_property(schema_fields.SchemaField(
             'text', 'Text', 'html', optional=True,
-            extra_schema_dict_values={
-                'supportCustomTags': tags.CAN_USE_DYNAMIC_TAGS.value,
-                'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
-                'className': 'mc-choice-text'}))
+            extra_schema_dict_values=_rich_text_extras(
+                can_use_dynamic_tags, 'mc-choice-text')))
         choice_type.add_property(schema_fields.SchemaField(
             'feedback', 'Feedback', 'html', optional=True,
-            extra_schema_dict_values={
-                'supportCustomTags': tags.CAN_USE_DYNAMIC_TAGS.value,
-                'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
-                'className': 'mc-choice-feedback'}))
+            extra_schema_dict_values=_rich_text_extras(
+                can_use_dynamic_tags, 'mc-choice-feedback')))
 
         choices_array = schema_fields.FieldArray(
             'choices', '', item_type=choice_type,
@@ -199,7 +256,7 @@ class McQuestionRESTHandler(BaseQuestionRESTHandler):
         question.type = QuestionDTO.MULTIPLE_CHOICE
 
     def transform_for_editor_hook(self, q_dict):
-        p_dict = copy.deepcopy(q_dict)
+        p_dict = dict(q_dict)
         # InputEx does not correctly roundtrip booleans, so pass strings
         p_dict['multiple_selections'] = (
             'true' if q_dict.get('multiple_selections') else 'false')
@@ -237,16 +294,16 @@ class McQuestionRESTHandler(BaseQuestionRESTHandler):
             errors.append('The question must have at least one choice.')
 
         choices = question_dict['choices']
-        for index in range(0, len(choices)):
-            choice = choices[index]
-            if not choice['text'].strip():
-                errors.append('Choice %s has no response text.' % (index + 1))
-            try:
-                # Coefrce the score attrib into a python float
-                choice['score'] = float(choice['score'])
-            except ValueError:
-                errors.append(
-                    'Choice %s must have a numeric score.' % (index + 1))
+        for number, choice in enumerate(choices, 1):
+            text = choice['text']
+            if not (text and text.strip()):
+                errors.append('Choice %s has no response text.' % number)
+            # Coerce the score attrib into a python float
+            score = _to_number(choice['score'], _FLOAT_RE, float)
+            if score is None:
+                errors.append('Choice %s must have a numeric score.' % number)
+            else:
+                choice['score'] = score
 
 
 class SaQuestionRESTHandler(BaseQuestionRESTHandler):
@@ -265,6 +322,8 @@ class SaQuestionRESTHandler(BaseQuestionRESTHandler):
         ('case_insensitive', 'Case insensitive string match'),
         ('regex', 'Regular expression'),
         ('numeric', 'Numeric')]
+    _GRADER_MATCHERS = frozenset(
+        matcher for matcher, unused_text in GRADER_TYPES)
 
     SCHEMA_VERSIONS = ['1.5']
 
@@ -273,6 +332,10 @@ class SaQuestionRESTHandler(BaseQuestionRESTHandler):
     @classmethod
     def get_schema(cls):
         """Get the InputEx schema for the short answer question editor."""
+        return _get_cached_schema(cls)[0]
+
+    @classmethod
+    def _build_schema(cls, can_use_dynamic_tags):
         sa_question = schema_fields.FieldRegistry(
             'Short Answer Question',
             description='short answer question',
@@ -282,10 +345,8 @@ class SaQuestionRESTHandler(BaseQuestionRESTHandler):
             'version', '', 'string', optional=True, hidden=True))
         sa_question.add_property(schema_fields.SchemaField(
             'question', 'Question', 'html', optional=True,
-            extra_schema_dict_values={
-                'supportCustomTags': tags.CAN_USE_DYNAMIC_TAGS.value,
-                'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
-                'className': 'sa-question'}))
+            extra_schema_dict_values=_rich_text_extras(
+                can_use_dynamic_tags, 'sa-question')))
         sa_question.add_property(schema_fields.SchemaField(
             'description', 'Description', 'string', optional=True,
             extra_schema_dict_values={'className': 'sa-description'},
@@ -295,10 +356,8 @@ class SaQuestionRESTHandler(BaseQuestionRESTHandler):
             extra_schema_dict_values={'className': 'sa-hint'}))
         sa_question.add_property(schema_fields.SchemaField(
             'defaultFeedback', 'Feedback', 'html', optional=True,
-            extra_schema_dict_values={
-                'supportCustomTags': tags.CAN_USE_DYNAMIC_TAGS.value,
-                'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
-                'className': 'sa-feedback'},
+            extra_schema_dict_values=_rich_text_extras(
+                can_use_dynamic_tags, 'sa-feedback'),
             description=messages.INCORRECT_ANSWER_FEEDBACK))
 
         sa_question.add_property(schema_fields.SchemaField(
@@ -331,10 +390,8 @@ class SaQuestionRESTHandler(BaseQuestionRESTHandler):
             extra_schema_dict_values={'className': 'sa-grader-text'}))
         grader_type.add_property(schema_fields.SchemaField(
             'feedback', 'Feedback', 'html', optional=True,
-            extra_schema_dict_values={
-                'supportCustomTags': tags.CAN_USE_DYNAMIC_TAGS.value,
-                'excludedCustomTags': TAGS_EXCLUDED_FROM_QUESTIONS,
-                'className': 'sa-grader-feedback'}))
+            extra_schema_dict_values=_rich_text_extras(
+                can_use_dynamic_tags, 'sa-grader-feedback')))
 
         graders_array = schema_fields.FieldArray(
             'graders', '', item_type=grader_type,
@@ -376,37 +433,33 @@ class SaQuestionRESTHandler(BaseQuestionRESTHandler):
         self.validate_no_description_collision(
             question_dict['description'], key, errors)
 
-        try:
-            # Coerce the rows attrib into a python int
-            question_dict['rows'] = int(question_dict['rows'])
-            if question_dict['rows'] <= 0:
-                errors.append('Rows must be a positive whole number')
-        except ValueError:
-            errors.append('Rows must be a whole number')
-
-        try:
-            # Coerce the cols attrib into a python int
-            question_dict['columns'] = int(question_dict['columns'])
-            if question_dict['columns'] <= 0:
-                errors.append('Columns must be a positive whole number')
-        except ValueError:
-            errors.append('Columns must be a whole number')
+        self._validate_pos_int(question_dict, 'rows', 'Rows', errors)
+        self._validate_pos_int(question_dict, 'columns', 'Columns', errors)
 
         if not question_dict['graders']:
             errors.append('The question must have at least one answer.')
 
         graders = question_dict['graders']
-        for index in range(0, len(graders)):
-            grader = graders[index]
-            assert grader['matcher'] in [
-                matcher for (matcher, unused_text) in self.GRADER_TYPES]
+        for number, grader in enumerate(graders, 1):
+            assert grader['matcher'] in self._GRADER_MATCHERS
             if not grader['response'].strip():
-                errors.append('Answer %s has no response text.' % (index + 1))
-            try:
-                float(grader['score'])
-            except ValueError:
-                errors.append(
-                    'Answer %s must have a numeric score.' % (index + 1))
+                errors.append('Answer %s has no response text.' % number)
+            # Coerce the score attrib into a python float
+            score = _to_number(grader['score'], _FLOAT_RE, float)
+            if score is None:
+                errors.append('Answer %s must have a numeric score.' % number)
+            else:
+                grader['score'] = score
+
+    def _validate_pos_int(self, question_dict, key, label, errors):
+        """Coerce question_dict[key] into a positive python int."""
+        value = _to_number(question_dict[key], _INT_RE, int)
+        if value is None:
+            errors.append('%s must be a whole number' % label)
+        else:
+            question_dict[key] = value
+            if value <= 0:
+                errors.append('%s must be a positive whole number' % label)
 
 
 class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
@@ -423,6 +476,15 @@ class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
     @classmethod
     def get_schema(cls):
         """Get the InputEx schema for the short answer question editor."""
+        return _get_cached_schema(cls)[0]
+
+    @classmethod
+    def get_json_schema_dict(cls):
+        """Get the JSON schema dict of the schema returned by get_schema()."""
+        return _get_cached_schema(cls)[1]
+
+    @classmethod
+    def _build_schema(cls, unused_can_use_dynamic_tags):
         gift_questions = schema_fields.FieldRegistry(
             'GIFT Questions',
             description='One or more GIFT-formatted questions',
@@ -443,16 +505,8 @@ class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
             extra_schema_dict_values={'className': 'gift-questions'}))
         return gift_questions
 
-    def validate_question_descriptions(self, questions, errors):
-        descriptions = [q.description for q in QuestionDAO.get_all()]
-        for question in questions:
-            if question['description'] in descriptions:
-                errors.append(
-                    ('The description must be different '
-                     'from existing questions.'))
-
     def validate_group_description(self, group_description, errors):
-        descriptions = [gr.description for gr in QuestionGroupDAO.get_all()]
+        descriptions = QuestionGroupDAO.get_question_groups_descriptions()
         if group_description in descriptions:
             errors.append('Non-unique group description.')
 
@@ -461,17 +515,11 @@ class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
             'questions': '',
             'description': ''}
 
-    def convert_to_dtos(self, questions):
-        dtos = []
-        for question in questions:
-            question['version'] = QuestionDAO.VERSION
-            dto = QuestionDTO(None, question)
-            if dto.type == 'multi_choice':
-                dto.type = QuestionDTO.MULTIPLE_CHOICE
-            else:
-                dto.type = QuestionDTO.SHORT_ANSWER
-            dtos.append(dto)
-        return dtos
+    def convert_to_dto(self, question):
+        question['version'] = QuestionDAO.VERSION
+        dto = QuestionDTO(None, question)
+        dto.type = _GIFT_TYPE_MAP.get(dto.type, QuestionDTO.SHORT_ANSWER)
+        return dto
 
     def create_group(self, description, question_ids):
         group = {
@@ -479,8 +527,8 @@ class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
             'description': description,
             'introduction': '',
             'items': [{
-                'question': str(x),
-                'weight': 1.0} for x in question_ids]}
+                'question': x,
+                'weight': 1.0} for x in map(str, question_ids)]}
         return QuestionGroupDAO.create_question_group(group)
 
     def put(self):
@@ -501,26 +549,41 @@ class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
         errors = []
         try:
             python_dict = transforms.json_to_dict(
-                json_dict, self.get_schema().get_json_schema_dict())
-            questions = gift.GiftParser.parse_questions(
-                python_dict['questions'])
-            self.validate_question_descriptions(questions, errors)
-            self.validate_group_description(
-                python_dict['description'], errors)
-            if not errors:
-                dtos = self.convert_to_dtos(questions)
-                question_ids = QuestionDAO.save_all(dtos)
-                self.create_group(python_dict['description'], question_ids)
-        except ValueError as e:
-            errors.append(str(e))
-        except gift.ParseError as e:
-            errors.append(str(e))
-        except CollisionError as e:
+                json_dict, self.get_json_schema_dict())
+            # Check and convert each question in the same pass as parsing.
+            descriptions = QuestionDAO.get_questions_descriptions()
+            dtos = []
+            for question in gift.GiftParser.iter_parse_questions(
+                    python_dict['questions']):
+                if question['description'] in descriptions:
+                    errors.append(
+                        'The description must be different '
+                        'from existing questions.')
+                dtos.append(self.convert_to_dto(question))
+        except (ValueError, gift.ParseError) as e:
             errors.append(str(e))
+            self.validation_error('\n'.join(errors))
+            return
+
+        self.validate_group_description(python_dict['description'], errors)
         if errors:
             self.validation_error('\n'.join(errors))
             return
 
+        try:
+            question_ids = QuestionDAO.save_all(dtos)
+            self.create_group(python_dict['description'], question_ids)
+        except CollisionError as e:
+            self.validation_error(str(e))
+            return
+
         msg = 'Saved: %s.' % python_dict['description']
         transforms.send_json_response(self, 200, msg)
         return
+
+
+# Build the editor schemas at import time rather than on the first request;
+# they are rebuilt only if the dynamic tags setting is changed later on.
+_get_cached_schema(McQuestionRESTHandler)
+_get_cached_schema(SaQuestionRESTHandler)
+_get_cached_schema(GiftQuestionRESTHandler)
@@ -64,12 +64,12 @@ ALL_TEST_CLASSES = {
     'tests.functional.model_entities.ExportEntityTestCase': 2,
     'tests.functional.model_entities.EntityTransformsTest': 4,
     'tests.functional.model_jobs.JobOperationsTest': 15,
-    'tests.functional.model_models.BaseJsonDaoTestCase': 1,
+    'tests.functional.model_models.BaseJsonDaoTestCase': 2,
     'tests.functional.model_models.ContentChunkTestCase': 15,
     'tests.functional.model_models.EventEntityTestCase': 1,
     'tests.functional.model_models.MemcacheManagerTestCase': 4,
     'tests.functional.model_models.PersonalProfileTestCase': 1,
-    'tests.functional.model_models.QuestionDAOTestCase': 3,
+    'tests.functional.model_models.QuestionDAOTestCase': 4,
     'tests.functional.model_models.StudentAnswersEntityTestCase': 1,
     'tests.functional.model_models.StudentProfileDAOTestCase': 6,
     'tests.functional.model_models.StudentPropertyEntityTestCase': 1,
@@ -99,6 +99,8 @@ ALL_TEST_CLASSES = {
     'tests.functional.modules_core_tags.TagsMarkdown': 1,
     'tests.functional.modules_courses.AccessDraftsTestCase': 2,
     'tests.functional.modules_dashboard.QuestionDashboardTestCase': 9,
+    'tests.functional.modules_dashboard.QuestionEditorSchemaTestCase': 2,
+    'tests.functional.modules_dashboard.QuestionEditorValidationTestCase': 4,
     'tests.functional.modules_dashboard.CourseOutlineTestCase': 1,
     'tests.functional.modules_dashboard.DashboardAccessTestCase': 3,
     'tests.functional.modules_dashboard.RoleEditorTestCase': 3,
@@ -197,7 +199,7 @@ ALL_TEST_CLASSES = {
     'tests.functional.test_classes.VirtualFileSystemTest': 43,
     'tests.functional.test_classes.ImportActivityTests': 7,
     'tests.functional.test_classes.ImportAssessmentTests': 3,
-    'tests.functional.test_classes.ImportGiftQuestionsTests': 1,
+    'tests.functional.test_classes.ImportGiftQuestionsTests': 3,
     'tests.functional.unit_assessment.UnitPrePostAssessmentTest': 17,
     'tests.functional.unit_description.UnitDescriptionsTest': 1,
     'tests.functional.unit_header_footer.UnitHeaderFooterTest': 11,
@@ -242,7 +244,7 @@ ALL_TEST_CLASSES = {
     'tests.unit.gift_parser_tests.TestMultiChoiceMultipleSelectionQuestion': 3,
     'tests.unit.gift_parser_tests.TestHead': 2,
     'tests.unit.gift_parser_tests.TestMultiChoiceQuestion': 5,
-    'tests.unit.gift_parser_tests.TestCreateManyGiftQuestion': 1
+    'tests.unit.gift_parser_tests.TestCreateManyGiftQuestion': 2
 }
 EXPENSIVE_TESTS = ['tests.integration.test_classes']
 
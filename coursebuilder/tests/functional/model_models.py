@@ -24,6 +24,7 @@ from models import config
 from models import entities
 from models import models
 from models import services
+from models import transforms
 from modules.notifications import notifications
 from tests.functional import actions
 
@@ -413,6 +414,17 @@ class BaseJsonDaoTestCase(actions.TestBase):
 
         assert_bulk_load_succeeds()
 
+    def test_save_all_populates_cache(self):
+        dtos = [TestDto('dto_0', {'a': 0}), TestDto('dto_1', {'a': 1})]
+        self.assertEquals(['dto_0', 'dto_1'], TestDao.save_all(dtos))
+
+        memcache_entities = models.MemcacheManager.get_multi(
+            ['(entity:TestEntity:dto_0)', '(entity:TestEntity:dto_1)'])
+        self.assertEquals(2, len(memcache_entities))
+        self.assertEquals(
+            {'a': 1}, transforms.loads(
+                memcache_entities['(entity:TestEntity:dto_1)'].data))
+
 
 class QuestionDAOTestCase(actions.TestBase):
     """Functional tests for QuestionDAO."""
@@ -475,6 +487,24 @@ class QuestionDAOTestCase(actions.TestBase):
         self.assertFalse(models.QuestionDAO.load(not_found_id))
         self.assertEqual([], models.QuestionDAO.used_by(not_found_id))
 
+    def test_get_ids_by_description(self):
+        config.Registry.test_overrides = {models.CAN_USE_MEMCACHE.name: True}
+        try:
+            self.assertEqual(
+                [], models.QuestionDAO.get_ids_by_description('sky'))
+
+            question_dto = models.QuestionDTO(None, {'description': 'sky'})
+            question_id = models.QuestionDAO.save(question_dto)
+            self.assertEqual(
+                [question_id],
+                models.QuestionDAO.get_ids_by_description('sky'))
+
+            models.QuestionDAO.delete(models.QuestionDAO.load(question_id))
+            self.assertEqual(
+                [], models.QuestionDAO.get_ids_by_description('sky'))
+        finally:
+            config.Registry.test_overrides = {}
+
 
 class StudentTestCase(actions.ExportTestBase):
 
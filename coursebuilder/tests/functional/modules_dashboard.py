@@ -21,7 +21,9 @@ import time
 
 import actions
 from common import crypto
+from common import tags
 from common.utils import Namespace
+from models import config
 from models import courses
 from models import models
 from models import transforms
@@ -31,6 +33,8 @@ from models.roles import Roles
 from modules.dashboard import dashboard
 from modules.dashboard import tabs
 from modules.dashboard.dashboard import DashboardHandler
+from modules.dashboard.question_editor import McQuestionRESTHandler
+from modules.dashboard.question_editor import SaQuestionRESTHandler
 from modules.dashboard.question_group_editor import QuestionGroupRESTHandler
 from modules.dashboard.role_editor import RoleRESTHandler
 
@@ -346,6 +350,110 @@ class QuestionDashboardTestCase(actions.TestBase):
         self.assertEquals(response['status'], 500)
 
 
+class QuestionEditorSchemaTestCase(actions.TestBase):
+    """Tests the schemas of the question REST handlers."""
+
+    def tearDown(self):
+        config.Registry.test_overrides = {}
+        super(QuestionEditorSchemaTestCase, self).tearDown()
+
+    def test_schema_is_built_once(self):
+        for handler in (McQuestionRESTHandler, SaQuestionRESTHandler):
+            self.assertIs(handler.get_schema(), handler.get_schema())
+            self.assertIs(
+                handler.get_json_schema_dict(), handler.get_json_schema_dict())
+            self.assertEquals(
+                handler.get_schema().get_json_schema_dict(),
+                handler.get_json_schema_dict())
+
+    def test_schema_follows_dynamic_tags_setting(self):
+        config.Registry.test_overrides = {
+            tags.CAN_USE_DYNAMIC_TAGS.name: True}
+        schema_with_tags = McQuestionRESTHandler.get_schema()
+        config.Registry.test_overrides = {
+            tags.CAN_USE_DYNAMIC_TAGS.name: False}
+        schema_without_tags = McQuestionRESTHandler.get_schema()
+
+        self.assertIsNot(schema_with_tags, schema_without_tags)
+        self.assertTrue(schema_with_tags.get_property(
+            'question').extra_schema_dict_values['supportCustomTags'])
+        self.assertFalse(schema_without_tags.get_property(
+            'question').extra_schema_dict_values['supportCustomTags'])
+
+
+class QuestionEditorValidationTestCase(actions.TestBase):
+    """Tests validation of questions submitted to the question editors."""
+
+    def test_mc_choice_scores_are_coerced_to_float(self):
+        question_dict = {
+            'question': 'What color is the sky?',
+            'description': 'sky',
+            'choices': [
+                {'text': 'blue', 'score': '1'},
+                {'text': 'red', 'score': ' -0.5 '},
+                {'text': 'green', 'score': 0}]}
+        errors = []
+        McQuestionRESTHandler().validate(question_dict, None, '1.5', errors)
+
+        self.assertEquals([], errors)
+        self.assertEquals(
+            [1.0, -0.5, 0.0],
+            [choice['score'] for choice in question_dict['choices']])
+
+    def test_mc_non_numeric_choice_scores_are_rejected(self):
+        question_dict = {
+            'question': 'What color is the sky?',
+            'description': 'sky',
+            'choices': [
+                {'text': 'blue', 'score': 'one'},
+                {'text': 'red', 'score': 'nan'},
+                {'text': ' ', 'score': '0'}]}
+        errors = []
+        McQuestionRESTHandler().validate(question_dict, None, '1.5', errors)
+
+        self.assertEquals([
+            'Choice 1 must have a numeric score.',
+            'Choice 2 must have a numeric score.',
+            'Choice 3 has no response text.'], errors)
+        self.assertEquals('one', question_dict['choices'][0]['score'])
+
+    def test_sa_rows_and_columns_are_coerced_to_int(self):
+        question_dict = {
+            'question': 'What color is the sky?',
+            'description': 'sky',
+            'rows': '2',
+            'columns': 30,
+            'graders': [{
+                'score': '1.0',
+                'matcher': 'case_insensitive',
+                'response': 'blue'}]}
+        errors = []
+        SaQuestionRESTHandler().validate(question_dict, None, '1.5', errors)
+
+        self.assertEquals([], errors)
+        self.assertEquals(2, question_dict['rows'])
+        self.assertEquals(30, question_dict['columns'])
+        self.assertEquals(1.0, question_dict['graders'][0]['score'])
+
+    def test_sa_invalid_rows_columns_and_scores_are_rejected(self):
+        question_dict = {
+            'question': 'What color is the sky?',
+            'description': 'sky',
+            'rows': '1.5',
+            'columns': '-3',
+            'graders': [{
+                'score': 'full',
+                'matcher': 'case_insensitive',
+                'response': 'blue'}]}
+        errors = []
+        SaQuestionRESTHandler().validate(question_dict, None, '1.5', errors)
+
+        self.assertEquals([
+            'Rows must be a whole number',
+            'Columns must be a positive whole number',
+            'Answer 1 must have a numeric score.'], errors)
+
+
 class CourseOutlineTestCase(actions.TestBase):
     """Tests the Course Outline."""
     COURSE_NAME = 'outline'
@@ -5156,6 +5156,51 @@ class ImportGiftQuestionsTests(DatastoreBackedCourseTest):
         assert_equals(response.status_int, 200)
         assert_contains('gift group', response.body)
 
+    def test_import_gift_questions_rejects_existing_descriptions(self):
+        email = 'gift@google.com'
+        actions.login(email, is_admin=True)
+
+        payload_dict = {
+            'description': 'gift group',
+            'questions': '::title mc::q1? {=c ~w}'}
+        request = {}
+        request['payload'] = transforms.dumps(payload_dict)
+        request[
+            'xsrf_token'] = XsrfTokenManager.create_xsrf_token(
+            'import-gift-questions')
+        url = '/rest/question/gift?%s' % urllib.urlencode(
+            {'request': transforms.dumps(request)})
+
+        response = transforms.loads(self.testapp.put(url, {}).body)
+        assert_equals(200, response['status'])
+
+        response = transforms.loads(self.testapp.put(url, {}).body)
+        assert_equals(412, response['status'])
+        assert_contains(
+            'The description must be different from existing questions.',
+            response['message'])
+        assert_contains('Non-unique group description.', response['message'])
+
+    def test_import_gift_questions_reports_parse_errors(self):
+        email = 'gift@google.com'
+        actions.login(email, is_admin=True)
+
+        payload_dict = {
+            'description': 'gift group',
+            'questions': '::title mc::q1? {=c ~w'}
+        request = {}
+        request['payload'] = transforms.dumps(payload_dict)
+        request[
+            'xsrf_token'] = XsrfTokenManager.create_xsrf_token(
+            'import-gift-questions')
+        response = transforms.loads(self.testapp.put(
+            '/rest/question/gift?%s' % urllib.urlencode(
+                {'request': transforms.dumps(request)}), {}).body)
+        assert_equals(412, response['status'])
+        with Namespace(self.namespace):
+            assert_equals([], models.QuestionDAO.get_all())
+            assert_equals([], models.QuestionGroupDAO.get_all())
+
 
 class NamespaceTest(actions.TestBase):
 
@@ -357,3 +357,11 @@ class TestCreateManyGiftQuestion(unittest.TestCase):
             ['multi_choice'] * 4 + ['short_answer'] * 3,
             [x['type'] for x in questions])
 
+    def test_iter_parse_questions_yields_converted_questions(self):
+        gift_text = '::t1:: q1? {=c1 ~w1}\n\n::t2:: q2? {T}'
+        questions = gift.GiftParser.iter_parse_questions(gift_text)
+        self.assertFalse(isinstance(questions, list))
+        self.assertEqual(
+            [('t1', 'multi_choice'), ('t2', 'multi_choice')],
+            [(x['description'], x['type']) for x in questions])
+